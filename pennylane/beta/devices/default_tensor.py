@@ -15,8 +15,11 @@ r"""
 Experimental simulator plugin based on tensor network contractions
 """
 # pylint: disable=too-many-instance-attributes
+import functools
 import warnings
+from collections import OrderedDict
 from itertools import product
+from string import ascii_letters as ABC
 
 import numpy as np
 
@@ -33,10 +36,112 @@ try:
 except ImportError as e:
     raise ImportError("default.tensor device requires TensorNetwork>=0.3") from e
 
+import opt_einsum
+
+try:
+    from numba import njit, prange
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 
 # tolerance for numerical errors
 TOL = 1e-10
 
+
+@functools.lru_cache(maxsize=128)
+def _gate_scatter_indices(wire_labels, num_wires):
+    """Index table for applying a gate to a flattened state vector.
+
+    A circuit's operation sequence and wire layout are fixed while its
+    parameters vary between executions, so the index tables - the only
+    parameter-independent part of dense gate application - are memoized.
+    Repeated executions of the same circuit then run a fully specialized
+    gather/apply/scatter per gate without rebuilding any index arithmetic.
+    The returned array must not be modified.
+
+    Args:
+        wire_labels (tuple[int]): device wires the gate acts on
+        num_wires (int): total number of wires
+
+    Returns:
+        array[int]: array ``idx`` of shape ``(2**k, 2**(num_wires - k))`` for a
+        ``k``-wire gate, such that ``state[idx]`` gathers the amplitude groups
+        the gate acts on; row ``r`` enumerates the computational basis states
+        of the gate's wires in lexicographic order
+    """
+    k = len(wire_labels)
+    shifts = [num_wires - 1 - w for w in wire_labels]
+
+    # spread a 2**(n-k) counter over the bit positions not acted on
+    base = np.arange(1 << (num_wires - k), dtype=np.intp)
+    for s in sorted(shifts):
+        base = ((base >> s) << (s + 1)) | (base & ((1 << s) - 1))
+
+    masks = [1 << s for s in shifts]
+    offsets = np.array(
+        [sum(m for j, m in enumerate(masks) if (r >> (k - 1 - j)) & 1) for r in range(1 << k)],
+        dtype=np.intp,
+    )
+    return offsets[:, None] | base[None, :]
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True, parallel=True)
+    def _apply_1q_kernel(state, A, target, num_wires):  # pragma: no cover
+        """Apply a single-qubit gate to a flattened state vector in place.
+
+        Args:
+            state (array[complex]): flattened state vector of length ``2**num_wires``
+            A (array[complex]): 2x2 gate matrix
+            target (int): device wire the gate acts on
+            num_wires (int): total number of wires
+        """
+        shift = num_wires - 1 - target
+        mask = 1 << shift
+        for i in prange(1 << (num_wires - 1)):  # pylint: disable=not-an-iterable
+            i0 = ((i >> shift) << (shift + 1)) | (i & (mask - 1))
+            i1 = i0 | mask
+            x0 = state[i0]
+            x1 = state[i1]
+            state[i0] = A[0, 0] * x0 + A[0, 1] * x1
+            state[i1] = A[1, 0] * x0 + A[1, 1] * x1
+
+    @njit(cache=True, parallel=True)
+    def _apply_2q_kernel(state, A, wire0, wire1, num_wires):  # pragma: no cover
+        """Apply a two-qubit gate to a flattened state vector in place.
+
+        Args:
+            state (array[complex]): flattened state vector of length ``2**num_wires``
+            A (array[complex]): 4x4 gate matrix
+            wire0 (int): first device wire the gate acts on
+            wire1 (int): second device wire the gate acts on
+            num_wires (int): total number of wires
+        """
+        shift0 = num_wires - 1 - wire0
+        shift1 = num_wires - 1 - wire1
+        mask0 = 1 << shift0
+        mask1 = 1 << shift1
+        low = min(shift0, shift1)
+        high = max(shift0, shift1)
+        for i in prange(1 << (num_wires - 2)):  # pylint: disable=not-an-iterable
+            t = ((i >> low) << (low + 1)) | (i & ((1 << low) - 1))
+            base = ((t >> high) << (high + 1)) | (t & ((1 << high) - 1))
+            i01 = base | mask1
+            i10 = base | mask0
+            i11 = base | mask0 | mask1
+            x00 = state[base]
+            x01 = state[i01]
+            x10 = state[i10]
+            x11 = state[i11]
+            state[base] = A[0, 0] * x00 + A[0, 1] * x01 + A[0, 2] * x10 + A[0, 3] * x11
+            state[i01] = A[1, 0] * x00 + A[1, 1] * x01 + A[1, 2] * x10 + A[1, 3] * x11
+            state[i10] = A[2, 0] * x00 + A[2, 1] * x01 + A[2, 2] * x10 + A[2, 3] * x11
+            state[i11] = A[3, 0] * x00 + A[3, 1] * x01 + A[3, 2] * x10 + A[3, 3] * x11
+
+
 contract_fns = {
     "greedy": tn.contractors.greedy,
     "branch": tn.contractors.branch,
@@ -44,6 +149,42 @@ contract_fns = {
     "auto": tn.contractors.auto,
 }
 
+path_solvers = {
+    "greedy": opt_einsum.paths.greedy,
+    "branch": opt_einsum.paths.branch,
+    "optimal": opt_einsum.paths.optimal,
+    "auto": opt_einsum.paths.auto,
+}
+
+
+class _CachedPathOptimizer:
+    """Path-finding algorithm for :func:`tn.contractors.custom` that memoizes
+    the contraction path of a fixed network topology.
+
+    The ``default.tensor`` device rebuilds networks of identical structure on
+    every circuit evaluation; only the tensor values change between calls.
+    Reusing the path found on the first contraction amortizes the path search
+    over repeated evaluations, e.g., across the iterations of an optimization
+    loop.
+
+    Any stored path remains a valid pairwise contraction order for a network
+    of the same topology, so reuse never affects the contracted value.
+
+    Args:
+        method (str): contraction method used to find the path on the first
+            invocation; one of ``"auto"``, ``"greedy"``, ``"branch"``, or
+            ``"optimal"``
+    """
+
+    def __init__(self, method):
+        self.method = method
+        self.path = None
+
+    def __call__(self, inputs, output, size_dict, memory_limit=None):
+        if self.path is None:
+            self.path = path_solvers[self.method](inputs, output, size_dict, memory_limit)
+        return self.path
+
 
 class DefaultTensor(Device):
     """Experimental Tensor Network simulator device for PennyLane.
@@ -94,6 +235,9 @@ class DefaultTensor(Device):
             for the "exact" representation. Valid options are "auto", "greedy", "branch", or "optimal".
             See documentation of the `TensorNetwork library <https://tensornetwork.readthedocs.io/en/latest/>`_
             for more information about contraction methods.
+        precision (str): Numerical precision of the simulation. Valid options are "double"
+            (complex128, the default) or "single" (complex64). Single precision halves the
+            memory footprint and bandwidth of the simulated state at a small cost in accuracy.
     """
 
     # pylint: disable=attribute-defined-outside-init
@@ -147,22 +291,51 @@ class DefaultTensor(Device):
     _abs = staticmethod(np.abs)
     _squeeze = staticmethod(np.squeeze)
     _expand_dims = staticmethod(np.expand_dims)
+    _einsum = staticmethod(np.einsum)
+    _conj = staticmethod(np.conj)
 
     C_DTYPE = np.complex128
     R_DTYPE = np.float64
 
-    _zero_state = np.array([1.0, 0.0], dtype=C_DTYPE)
+    # dtypes used when single precision is requested
+    _single_precision_dtypes = (np.complex64, np.float32)
 
-    def __init__(self, wires, shots=1000, representation="exact", contraction_method="auto"):
+    _zero_state = np.array([1.0, 0.0], dtype=C_DTYPE)
+    _one_state = np.array([0.0, 1.0], dtype=C_DTYPE)
+
+    def __init__(
+        self,
+        wires,
+        shots=1000,
+        representation="exact",
+        contraction_method="auto",
+        precision="double",
+    ):
         super().__init__(wires, shots)
         if representation not in ["exact", "mps"]:
             raise ValueError("Invalid representation. Must be one of 'exact' or 'mps'.")
+        if precision not in ["single", "double"]:
+            raise ValueError("Invalid precision. Must be one of 'single' or 'double'.")
+
+        self._precision = precision
+        self.tolerance = TOL
+        if precision == "single":
+            # gate application is memory bound, so halving the state dtype
+            # roughly doubles throughput at a small cost in accuracy
+            self.C_DTYPE, self.R_DTYPE = self._single_precision_dtypes
+            self._zero_state = self._array(self._zero_state, dtype=self.C_DTYPE)
+            self._one_state = self._array(self._one_state, dtype=self.C_DTYPE)
+            self.tolerance = 1e-5
         self._operation_and_observable_map = {
             **self._operation_map,
             **self._observable_map,
         }
         self._rep = representation
         self._contraction_method = contraction_method
+        self._contraction_path_cache = {}
+        self._decomposition_cache = {}
+        self._operator_matrix_cache = {}
+        self._dense_state_buffer = None
         self.reset()
         self.analytic = False
 
@@ -175,7 +348,7 @@ class DefaultTensor(Device):
             supports_finite_shots=False,
             supports_tensor_observables=True,
             returns_state=False,
-            returns_probs=False,
+            returns_probs=True,
         )
         return capabilities
 
@@ -196,6 +369,12 @@ class DefaultTensor(Device):
         self._free_wire_edges = []
         self.mps = None
         self._contracted_state_node = None
+        self._conj_state_tensor = None
+
+        # bookkeeping for the dense contraction fast path used by the
+        # "exact" representation on the NumPy backend
+        self._initial_state_factors = []
+        self._applied_gates = []
 
     def _add_node(self, A, wires, name="UnnamedNode", key="state"):
         """Adds a node to the underlying tensor network.
@@ -258,6 +437,7 @@ class DefaultTensor(Device):
                     )
                 node = self._add_node(tensor, wires=wires, name=name)
                 self._free_wire_edges.extend(node.edges)
+                self._initial_state_factors.append(tensor)
 
         elif self._rep == "mps":
             nodes = []
@@ -300,9 +480,43 @@ class DefaultTensor(Device):
             )
             self._free_wire_edges = [node[1] for node in self.mps.nodes]
 
+    # maximum number of operator matrices retained in the per-device cache
+    _MATRIX_CACHE_SIZE = 4096
+
     def _get_operator_matrix(self, operation, par):
         """Get the operator matrix for a given operation or observable.
 
+        On the NumPy backend, matrices are cached keyed on the operation name
+        and parameter values, so that repeatedly applying a gate with the same
+        parameters (common with parameter sharing and across optimization
+        steps) skips rebuilding the matrix. Callers must not modify the
+        returned array in place.
+
+        Args:
+          operation (str): name of the operation/observable
+          par (tuple[float]): parameter values
+        Returns:
+          array: matrix representation.
+        """
+        if self.backend != "numpy":
+            return self._compute_operator_matrix(operation, par)
+
+        try:
+            key = (operation, tuple(float(p) for p in par))
+        except (TypeError, ValueError):
+            # non-scalar parameters (e.g., the matrix of a QubitUnitary)
+            return self._compute_operator_matrix(operation, par)
+
+        if key not in self._operator_matrix_cache:
+            if len(self._operator_matrix_cache) >= self._MATRIX_CACHE_SIZE:
+                self._operator_matrix_cache.clear()
+            self._operator_matrix_cache[key] = self._compute_operator_matrix(operation, par)
+
+        return self._operator_matrix_cache[key]
+
+    def _compute_operator_matrix(self, operation, par):
+        """Compute the operator matrix for a given operation or observable.
+
         Args:
           operation (str): name of the operation/observable
           par (tuple[float]): parameter values
@@ -341,7 +555,7 @@ class DefaultTensor(Device):
             par (tuple): parameter values for the state preparation
         """
         if operation == "QubitStateVector":
-            state_vector = self._array(par[0], dtype=self.C_DTYPE)
+            state_vector = self._asarray(par[0], dtype=self.C_DTYPE)
             if state_vector.ndim == 1 and state_vector.shape[0] == 2 ** self.num_wires:
                 tensors = [self._reshape(state_vector, [2] * self.num_wires)]
                 tensor_wires = [Wires(range(self.num_wires))]
@@ -358,9 +572,12 @@ class DefaultTensor(Device):
                         self.num_wires
                     )
                 )
-            zero_vec = self._array(self._zero_state, dtype=self.C_DTYPE)
-            one_vec = zero_vec[::-1]
-            tensors = [zero_vec if par[0][wire] == 0 else one_vec for wire in range(self.num_wires)]
+            # reuse the precomputed basis vectors rather than allocating new
+            # copies on every state preparation
+            tensors = [
+                self._zero_state if par[0][wire] == 0 else self._one_state
+                for wire in range(self.num_wires)
+            ]
             tensor_wires = [Wires(w) for w in range(self.num_wires)]
             name = [operation] * self.num_wires
 
@@ -387,6 +604,7 @@ class DefaultTensor(Device):
             for idx, l in enumerate(wires.labels):
                 tn.connect(op_node[num_wires + idx], self._free_wire_edges[l])
                 self._free_wire_edges[l] = op_node[idx]
+            self._applied_gates.append((A, wires.labels))
         elif self._rep == "mps":
             if len(wires) == 1:
                 reg = wires.labels[0]
@@ -407,6 +625,28 @@ class DefaultTensor(Device):
                     "Multi-wire gates only supported for nearest-neighbour wire pairs."
                 )
 
+    def _get_path_optimizer(self, network_type, nodes):
+        """Return a path optimizer for contracting ``nodes``, reusing the
+        contraction path found for earlier networks of identical topology.
+
+        The topology is identified by the type of network being contracted
+        together with the names of its nodes (which encode the operation names
+        and the wires they act on), so that repeated evaluations of the same
+        circuit with different parameter values skip the path search.
+
+        Args:
+            network_type (str): label distinguishing the kind of network being
+                contracted (e.g., ``"state"`` or ``"expectation"``)
+            nodes (Sequence[tn.Node]): nodes to be contracted
+
+        Returns:
+            _CachedPathOptimizer: memoizing path optimizer for this topology
+        """
+        key = (network_type, self._contraction_method, tuple(node.name for node in nodes))
+        if key not in self._contraction_path_cache:
+            self._contraction_path_cache[key] = _CachedPathOptimizer(self._contraction_method)
+        return self._contraction_path_cache[key]
+
     def _create_nodes_from_tensors(self, tensors, tensor_wires, observable_names, key):
         """Helper function for creating TensorNetwork nodes based on tensors.
 
@@ -424,11 +664,52 @@ class DefaultTensor(Device):
             for A, wires, o in zip(tensors, tensor_wires, observable_names)
         ]
 
+    def _release_observable_nodes(self):
+        """Drop the observable nodes recorded for previous measurements.
+
+        Observable nodes are stored in ``self._nodes`` purely for bookkeeping;
+        nothing reads them once their measurement has been contracted. Each
+        retained node (and the contraction intermediates reachable through its
+        edges) pins a dense tensor, so releasing them before every new
+        measurement keeps memory usage constant instead of growing with the
+        number of measurements performed on a state.
+        """
+        self._nodes.pop("observables", None)
+
+    @staticmethod
+    def _drop_identity_factors(observable, wires, par):
+        """Remove ``Identity`` factors from a tensor product of observables.
+
+        Identity factors act trivially on their wires and only inflate the
+        measurement network, so they can be dropped before any nodes are
+        created. Callers are expected to handle the all-identity case
+        separately, so at least one factor always remains.
+
+        Args:
+            observable (list[str]): observable name for each factor
+            wires (list[Wires]): measured subsystems for each factor
+            par (list[tuple]): parameter values for each factor
+
+        Returns:
+            tuple[list[str], list[Wires], list[tuple]]: the filtered factors
+        """
+        kept = [(o, w, p) for o, w, p in zip(observable, wires, par) if o != "Identity"]
+        observable, wires, par = (list(seq) for seq in zip(*kept))
+        return observable, wires, par
+
     def expval(self, observable, wires, par):
 
+        self._release_observable_nodes()
+
         if not isinstance(observable, list):
             observable, wires, par = [observable], [wires], [par]
 
+        # the expectation value of the identity is exactly 1; skip the contraction
+        if all(o == "Identity" for o in observable):
+            return 1.0
+        if "Identity" in observable:
+            observable, wires, par = self._drop_identity_factors(observable, wires, par)
+
         tensors = []
         for o, p, w in zip(observable, par, wires):
 
@@ -439,13 +720,131 @@ class DefaultTensor(Device):
         nodes = self._create_nodes_from_tensors(tensors, wires, observable, key="observables")
         return self.ev(nodes, wires)
 
+    def expval_many(self, observables, wires, par):
+        r"""Batched expectation values of several observables on the same state.
+
+        Evaluating a Hamiltonian :math:`\langle H\rangle = \sum_i c_i \langle P_i\rangle`
+        term by term via ``expval`` re-contracts a full :math:`\langle\psi|A|\psi\rangle`
+        network for every term. This method contracts the pre-measurement state
+        once and evaluates all terms against it. Terms consisting solely of
+        ``PauliZ`` and ``Identity`` factors share a single computation of the
+        computational-basis probabilities, so any number of such terms costs
+        one pass over the state plus one cheap diagonal contraction each.
+
+        Args:
+            observables (Sequence[str or list[str]]): observable name for each
+                term; a list of names denotes a tensor product
+            wires (Sequence[Wires or list[Wires]]): measured subsystems for each term
+            par (Sequence[tuple or list[tuple]]): parameter values for each term
+
+        Returns:
+            array[float]: expectation value of each term
+        """
+        if self._rep != "exact" or self.backend != "numpy":
+            return np.array([self.expval(o, w, p) for o, w, p in zip(observables, wires, par)])
+
+        self._release_observable_nodes()
+        self._contract_premeasurement_network()
+        psi = np.asarray(self._contracted_state_node.tensor)
+
+        probs = None
+        z_diag = np.array([1.0, -1.0])
+
+        results = np.empty(len(observables), dtype=np.float64)
+        for i, (obs, obs_wires, p) in enumerate(zip(observables, wires, par)):
+            if not isinstance(obs, list):
+                obs, obs_wires, p = [obs], [obs_wires], [p]
+
+            if all(o in ("PauliZ", "Identity") for o in obs):
+                if probs is None:
+                    probs = np.abs(psi) ** 2
+                measured_labels = [
+                    l
+                    for o, w in zip(obs, obs_wires)
+                    if o == "PauliZ"
+                    for l in self.map_wires(w).labels
+                ]
+                state_indices = ABC[: self.num_wires]
+                subscripts = ",".join([state_indices] + [ABC[l] for l in measured_labels]) + "->"
+                results[i] = np.einsum(subscripts, probs, *([z_diag] * len(measured_labels)))
+                continue
+
+            if "Identity" in obs:
+                obs, obs_wires, p = self._drop_identity_factors(obs, obs_wires, p)
+
+            matrices = [self._get_operator_matrix(o, param) for o, param in zip(obs, p)]
+            A_psi = self._apply_observables_to_state(matrices, obs_wires)
+            mean = np.vdot(psi.ravel(), A_psi.ravel())
+
+            if np.abs(mean.imag) > self.tolerance:
+                warnings.warn(
+                    "Nonvanishing imaginary part {} in expectation value.".format(mean.imag),
+                    RuntimeWarning,
+                )
+            results[i] = mean.real
+
+        return results
+
+    def _apply_observables_to_state(self, matrices, wires):
+        r"""Apply a tensor product of observables to the pre-measurement state.
+
+        Args:
+            matrices (Sequence[array]): matrix representation of each observable
+            wires (Sequence[Wires]): measured subsystems for each observable
+
+        Returns:
+            array: the dense tensor :math:`A|\psi\rangle` of shape ``[2] * num_wires``
+        """
+        self._contract_premeasurement_network()
+        state = np.asarray(self._contracted_state_node.tensor)
+
+        for A, obs_wires in zip(matrices, wires):
+
+            # translate to consecutive wire labels used by device
+            device_wires = self.map_wires(obs_wires)
+            labels = device_wires.labels
+            num_wires = len(labels)
+
+            A = np.reshape(A, [2] * num_wires * 2)
+            input_axes = tuple(range(num_wires, 2 * num_wires))
+            state = np.tensordot(A, state, axes=(input_axes, labels))
+            state = np.moveaxis(state, range(num_wires), labels)
+
+        return state
+
     def var(self, observable, wires, par):
 
+        self._release_observable_nodes()
+
         if not isinstance(observable, list):
             observable, wires, par = [observable], [wires], [par]
 
+        # the identity has zero variance; skip the contractions
+        if all(o == "Identity" for o in observable):
+            return 0.0
+        if "Identity" in observable:
+            observable, wires, par = self._drop_identity_factors(observable, wires, par)
+
         matrices = [self._get_operator_matrix(o, p) for o, p in zip(observable, par)]
 
+        if self._rep == "exact" and self.backend == "numpy":
+            # Computing the intermediate A|psi> once gives both moments:
+            # <A> = <psi|A psi> and <A^2> = <A psi|A psi>, by hermiticity of A.
+            # This halves the contraction count compared to computing <A^2>
+            # from the squared matrices.
+            A_psi = self._apply_observables_to_state(matrices, wires)
+            psi = np.asarray(self._contracted_state_node.tensor)
+
+            mean = np.vdot(psi.ravel(), A_psi.ravel())
+            mean_sq = np.vdot(A_psi.ravel(), A_psi.ravel()).real
+
+            if np.abs(mean.imag) > self.tolerance:
+                warnings.warn(
+                    "Nonvanishing imaginary part {} in expectation value.".format(mean.imag),
+                    RuntimeWarning,
+                )
+            return mean_sq - mean.real ** 2
+
         tensors = [self._reshape(A, [2] * len(w) * 2) for A, w in zip(matrices, wires)]
         tensors_of_squared_matrices = [
             self._reshape(A @ A, [2] * len(w) * 2) for A, w in zip(matrices, wires)
@@ -458,16 +857,110 @@ class DefaultTensor(Device):
 
         return self.ev(obs_nodes_for_squares, wires) - self.ev(obs_nodes, wires) ** 2
 
+    def _spectral_decomposition(self, observable, par):
+        r"""Spectral decomposition of an observable, cached per observable and parameters.
+
+        ``sample`` decomposes its observables on every invocation; since the
+        decomposition only depends on the observable and its parameters, the
+        result is cached so that repeated sampling of the same observables
+        skips the eigendecomposition.
+
+        Args:
+            observable (str): name of the observable
+            par (tuple[float]): parameter values
+
+        Returns:
+            tuple[array, array, list[array]]: eigenvalues :math:`a_k`, the matrix of
+            eigenvectors (as columns), and the Hermitian projectors :math:`P_k` such
+            that :math:`A = \sum_k a_k P_k`
+        """
+        try:
+            key = (observable, tuple(np.asarray(p).tobytes() for p in par))
+        except TypeError:
+            key = None
+
+        if key is None or key not in self._decomposition_cache:
+            A = self._get_operator_matrix(observable, par)
+            eigenvalues, eigenvectors = np.linalg.eigh(A)
+            projectors = [
+                np.outer(eigenvectors[:, k], eigenvectors[:, k].conj())
+                for k in range(eigenvalues.shape[0])
+            ]
+            if key is None:
+                return eigenvalues, eigenvectors, projectors
+            self._decomposition_cache[key] = (eigenvalues, eigenvectors, projectors)
+
+        return self._decomposition_cache[key]
+
+    def _joint_probabilities(self, decompositions, wires):
+        """Joint probabilities of all eigenvalue combinations of the given observables.
+
+        The state is rotated into the joint eigenbasis of the observables (one
+        small ``tensordot`` per observable) and the joint distribution is
+        obtained from a single amplitude-squared reduction, instead of
+        contracting a full bra-projectors-ket network per outcome.
+
+        Args:
+            decompositions (Sequence[tuple]): cached spectral decompositions, as
+                returned by ``_spectral_decomposition``, one per observable
+            wires (Sequence[Wires]): measured subsystems for each observable
+
+        Returns:
+            array[float]: flat array of joint probabilities, in the lexicographic
+            order generated by ``itertools.product`` over the eigenvalue groups
+        """
+        self._contract_premeasurement_network()
+        state = np.asarray(self._contracted_state_node.tensor)
+
+        measured_labels = []
+        for (_, eigenvectors, _), obs_wires in zip(decompositions, wires):
+
+            # translate to consecutive wire labels used by device
+            device_wires = self.map_wires(obs_wires)
+            labels = device_wires.labels
+            num_wires = len(labels)
+
+            # rotate the measured subsystem into the observable's eigenbasis
+            U = np.reshape(eigenvectors.conj().T, [2] * num_wires * 2)
+            input_axes = tuple(range(num_wires, 2 * num_wires))
+            state = np.tensordot(U, state, axes=(input_axes, labels))
+            state = np.moveaxis(state, range(num_wires), labels)
+            measured_labels.extend(labels)
+
+        probs = np.abs(state) ** 2
+        unmeasured_labels = [l for l in range(self.num_wires) if l not in measured_labels]
+        probs = np.transpose(probs, measured_labels + unmeasured_labels)
+        probs = np.reshape(probs, (2 ** len(measured_labels), -1)).sum(axis=1)
+
+        # guard against accumulated floating-point error in the normalization
+        return probs / probs.sum()
+
     def sample(self, observable, wires, par):
 
+        self._release_observable_nodes()
+
         if not isinstance(observable, list):
             observable, wires, par = [observable], [wires], [par]
 
-        matrices = [self._get_operator_matrix(o, p) for o, p in zip(observable, par)]
+        # every sample of the identity is its sole eigenvalue 1; skip sampling
+        if all(o == "Identity" for o in observable):
+            return np.ones(self.shots)
+        if "Identity" in observable:
+            observable, wires, par = self._drop_identity_factors(observable, wires, par)
+
+        decompositions = [self._spectral_decomposition(o, p) for o, p in zip(observable, par)]
+        eigenvalues = [d[0] for d in decompositions]
+
+        # The eigenvalue - projector maps are preserved as product() preserves
+        # the previous ordering by creating a lexicographic ordering
+        joint_outcomes = list(product(*eigenvalues))
+        outcomes = np.array([np.prod(p) for p in joint_outcomes])
+
+        if self._rep == "exact" and self.backend == "numpy":
+            joint_probabilities = self._joint_probabilities(decompositions, wires)
+            return np.random.choice(outcomes, self.shots, p=joint_probabilities)
 
-        decompositions = [ops.spectral_decomposition(A) for A in matrices]
-        eigenvalues, projector_groups = list(zip(*decompositions))
-        eigenvalues = list(eigenvalues)
+        projector_groups = [d[2] for d in decompositions]
 
         # Matching each projector with the wires it acts on
         # while preserving the groupings
@@ -476,9 +969,6 @@ class DefaultTensor(Device):
             for idx, proj_group in enumerate(projector_groups)
         ]
 
-        # The eigenvalue - projector maps are preserved as product() preserves
-        # the previous ordering by creating a lexicographic ordering
-        joint_outcomes = list(product(*eigenvalues))
         projector_tensor_products = list(product(*projectors_with_wires))
 
         joint_probabilities = []
@@ -494,7 +984,6 @@ class DefaultTensor(Device):
 
             joint_probabilities.append(self.ev(obs_nodes, obs_wires))
 
-        outcomes = np.array([np.prod(p) for p in joint_outcomes])
         return np.random.choice(outcomes, self.shots, p=joint_probabilities)
 
     def ev(self, obs_nodes, obs_wires):
@@ -512,7 +1001,7 @@ class DefaultTensor(Device):
         elif self._rep == "mps":
             expval = self._ev_mps(obs_nodes, obs_wires)
 
-        if self._abs(self._imag(expval)) > TOL:
+        if self._abs(self._imag(expval)) > self.tolerance:
             warnings.warn(
                 "Nonvanishing imaginary part {} in expectation value.".format(expval.imag),
                 RuntimeWarning,
@@ -531,7 +1020,16 @@ class DefaultTensor(Device):
         """
         self._contract_premeasurement_network()
         ket = self._contracted_state_node
-        bra = tn.conj(ket, name="Bra")
+
+        # The conjugated state tensor is cached, so that measuring several
+        # observables against the same state (e.g., the terms of a Hamiltonian)
+        # only materializes the conjugate copy once. A fresh bra node is still
+        # required per contraction, since its edges are consumed.
+        if self._conj_state_tensor is None:
+            bra = tn.conj(ket, name="Bra")
+            self._conj_state_tensor = bra.tensor
+        else:
+            bra = tn.Node(self._conj_state_tensor, name="Bra", backend=self.backend)
 
         all_device_wires = Wires(range(self.num_wires))
         meas_device_wires = []
@@ -559,11 +1057,12 @@ class DefaultTensor(Device):
             tn.connect(bra[w], ket[w])
 
         # At this stage, all nodes are connected, and the contraction yields a
-        # scalar value.
-        ket_and_observable_node = ket
-        for obs_node in obs_nodes:
-            ket_and_observable_node = tn.contract_between(obs_node, ket_and_observable_node)
-        return tn.contract_between(bra, ket_and_observable_node).tensor
+        # scalar value. The contraction order is determined by the configured
+        # contraction method, avoiding the exponentially large intermediate
+        # tensors produced by naively contracting each observable into the ket.
+        nodes = [bra, ket] + list(obs_nodes)
+        optimizer = self._get_path_optimizer("expectation", nodes)
+        return tn.contractors.custom(nodes, optimizer).tensor
 
     def _ev_mps(self, obs_nodes, obs_wires):
         r"""Expectation value of observables on specified wires using a MPS representation.
@@ -629,15 +1128,138 @@ class DefaultTensor(Device):
             expval = self._squeeze(expval_node.tensor)
         return expval
 
+    def _use_dense_contraction(self):
+        """Whether the dense contraction fast path can produce the pre-measurement state.
+
+        The fast path requires the ``"exact"`` representation on the NumPy
+        backend, and is only valid if every node in the state network was
+        recorded by ``_add_initial_state_nodes`` or ``_add_gate_nodes`` (i.e.,
+        no nodes were added to the network directly).
+
+        Returns:
+            bool: whether the dense fast path applies
+        """
+        num_recorded = len(self._initial_state_factors) + len(self._applied_gates)
+        return (
+            self._rep == "exact"
+            and self.backend == "numpy"
+            and len(self._initial_state_factors) > 0
+            and len(self._nodes.get("state", [])) == num_recorded
+        )
+
+    def _dense_initial_state(self):
+        """The initial state as a flat dense vector, built in a reusable buffer.
+
+        Allocating a fresh ``2**num_wires`` array on every circuit evaluation
+        is wasteful when the device is evaluated many times, e.g. inside an
+        optimization loop. A persistent buffer is refilled in place instead;
+        in the common case where every initial-state factor is a single-wire
+        basis vector, refilling amounts to a ``fill(0)`` and a single element
+        write. Since the buffer is reused, the state tensor of a previous
+        evaluation is overwritten by the next one.
+
+        Returns:
+            array: flat dense state vector of length ``2**num_wires``
+        """
+        factors = self._initial_state_factors
+        size = 2 ** sum(tensor.ndim for tensor in factors)
+
+        buf = self._dense_state_buffer
+        if buf is None or buf.shape[0] != size or buf.dtype != np.dtype(self.C_DTYPE):
+            buf = np.empty(size, dtype=self.C_DTYPE)
+            self._dense_state_buffer = buf
+
+        # If every factor is a single-wire basis vector (the zero state and
+        # BasisState preparations), the dense state has a single nonzero entry.
+        index = 0
+        is_basis_state = True
+        for tensor in factors:
+            if tensor.ndim != 1:
+                is_basis_state = False
+                break
+            if tensor[0] == 1 and tensor[1] == 0:
+                bit = 0
+            elif tensor[0] == 0 and tensor[1] == 1:
+                bit = 1
+            else:
+                is_basis_state = False
+                break
+            index = (index << 1) | bit
+
+        if is_basis_state:
+            buf.fill(0)
+            buf[index] = 1
+            return buf
+
+        state = factors[0]
+        for tensor in factors[1:]:
+            state = np.tensordot(state, tensor, axes=0)
+        np.copyto(buf, np.reshape(state, -1))
+        return buf
+
+    def _contract_dense_state(self):
+        """Contract the state preparation and gate applications into a dense state tensor.
+
+        Instead of handing the state network to the generic contractor, the
+        recorded gates are applied to the state in circuit order with direct
+        ``np.tensordot`` calls. For circuits dominated by one- and two-qubit
+        gates this avoids the per-node bookkeeping overhead of the tensor
+        network machinery, which dwarfs the cost of the small contractions
+        themselves.
+
+        Returns:
+            array: dense state tensor of shape ``[2] * num_wires``
+        """
+        # Fuse runs of consecutive gates acting on an identical wire set into a
+        # single matrix (e.g., the RZ-RX-RZ Euler pattern), so that each run
+        # streams the full state through memory once instead of once per gate.
+        fused_gates = []
+        for A, wire_labels in self._applied_gates:
+            if fused_gates and fused_gates[-1][1] == wire_labels:
+                B, _ = fused_gates[-1]
+                dim = 2 ** len(wire_labels)
+                AB = np.reshape(A, (dim, dim)) @ np.reshape(B, (dim, dim))
+                fused_gates[-1] = (np.reshape(AB, A.shape), wire_labels)
+            else:
+                fused_gates.append((A, wire_labels))
+
+        # Gates are applied in place to a flat contiguous state vector using
+        # bit-indexed gather/apply/scatter, the canonical state-vector layout.
+        # This avoids the transpose/reshape round-trips (and their copies)
+        # that reshaped [2]*n gate application incurs.
+        num_wires = sum(tensor.ndim for tensor in self._initial_state_factors)
+        flat_state = self._dense_initial_state()
+
+        for A, wire_labels in fused_gates:
+            k = len(wire_labels)
+            A = np.asarray(np.reshape(A, (2 ** k, 2 ** k)), dtype=flat_state.dtype)
+
+            if HAS_NUMBA and k <= 2:
+                if k == 1:
+                    _apply_1q_kernel(flat_state, A, wire_labels[0], num_wires)
+                else:
+                    _apply_2q_kernel(flat_state, A, wire_labels[0], wire_labels[1], num_wires)
+                continue
+
+            idx = _gate_scatter_indices(wire_labels, num_wires)
+            flat_state[idx] = A @ flat_state[idx]
+
+        return flat_state.reshape([2] * num_wires)
+
     def _contract_premeasurement_network(self):
         """Contract the nodes which represent the state preparation and gate applications to get the pre-measurement state.
 
         The contracted tensor is cached in the attribute ``_contracted_state_node``.
         """
         if self._contracted_state_node is None:
-            if self._rep == "exact":
-                contract_fn = contract_fns[self._contraction_method]
-                ket = contract_fn(self._nodes["state"], output_edge_order=self._free_wire_edges)
+            if self._use_dense_contraction():
+                ket = tn.Node(self._contract_dense_state(), name="Ket", backend=self.backend)
+            elif self._rep == "exact":
+                nodes = self._nodes["state"]
+                optimizer = self._get_path_optimizer("state", nodes)
+                ket = tn.contractors.custom(
+                    nodes, optimizer, output_edge_order=self._free_wire_edges
+                )
             elif self._rep == "mps":
                 # contract all mutual edges
                 for idx, node in enumerate(self.mps.nodes):
@@ -667,6 +1289,40 @@ class DefaultTensor(Device):
         ket = self._contracted_state_node
         return self._squeeze(ket.tensor)
 
+    def probability(self, wires=None):
+        """Return the (marginal) probability of each computational basis
+        state from the last run of the device.
+
+        The full marginal distribution is obtained from a single einsum
+        contraction of the state with its conjugate, instead of one
+        amplitude-squared reduction per basis state.
+
+        Args:
+            wires (Wires): wires to return marginal probabilities for.
+                Wires not provided are traced out of the system.
+
+        Returns:
+            OrderedDict[tuple, float]: Dictionary mapping a tuple representing the state
+            to the resulting probability. The dictionary is sorted such that the
+            state tuples are in lexicographical order.
+        """
+        if wires is None:
+            wires = self.wires
+
+        # translate to consecutive wire labels used by device
+        device_wires = self.map_wires(wires)
+
+        state = self._state()
+
+        state_indices = ABC[: self.num_wires]
+        output_indices = "".join(ABC[l] for l in device_wires.labels)
+        subscripts = "{0},{0}->{1}".format(state_indices, output_indices)
+        probs = self._real(self._einsum(subscripts, state, self._conj(state)))
+
+        probs = self._reshape(probs, [-1])
+        basis_states = product([0, 1], repeat=len(device_wires))
+        return OrderedDict(zip(basis_states, probs))
+
     @property
     def contraction_method(self):
         """The contraction method used by the tensor network.
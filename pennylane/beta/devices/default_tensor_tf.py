@@ -140,11 +140,22 @@ class DefaultTensorTF(DefaultTensor):
     _abs = staticmethod(tf.abs)
     _squeeze = staticmethod(tf.squeeze)
     _expand_dims = staticmethod(tf.expand_dims)
+    _einsum = staticmethod(tf.einsum)
+    _conj = staticmethod(tf.math.conj)
 
     C_DTYPE = ops.C_DTYPE
     R_DTYPE = ops.R_DTYPE
 
-    def __init__(self, wires, shots=1000, representation="exact", contraction_method="auto"):
+    _single_precision_dtypes = (tf.complex64, tf.float32)
+
+    def __init__(
+        self,
+        wires,
+        shots=1000,
+        representation="exact",
+        contraction_method="auto",
+        precision="double",
+    ):
         self.variables = []
         """List[tf.Variable]: Free parameters, cast to TensorFlow variables,
         for this circuit."""
@@ -166,6 +177,7 @@ class DefaultTensorTF(DefaultTensor):
             shots=shots,
             representation=representation,
             contraction_method=contraction_method,
+            precision=precision,
         )
 
     @classmethod
@@ -177,6 +189,25 @@ class DefaultTensorTF(DefaultTensor):
         )
         return capabilities
 
+    def _compute_operator_matrix(self, operation, par):
+        """Compute the operator matrix for a given operation or observable.
+
+        The parametrized matrices from ``pennylane.devices.tf_ops`` are always
+        built in complex128; ``tf.convert_to_tensor`` refuses to downcast an
+        existing tensor, so the matrix is cast to the device dtype instead.
+        This keeps the ``precision="single"`` option working on this device.
+
+        Args:
+          operation (str): name of the operation/observable
+          par (tuple[float]): parameter values
+        Returns:
+          tf.Tensor: matrix representation.
+        """
+        A = self._operation_and_observable_map[operation]
+        if not callable(A):
+            return self._array(A, dtype=self.C_DTYPE)
+        return tf.cast(self._asarray(A(*par)), self.C_DTYPE)
+
     def reset(self):
         self.res = None
         self.variables = []
@@ -45,9 +45,15 @@ class MeasurementProcess:
 
     # pylint: disable=too-few-public-methods
 
+    # Workflows such as the parameter-shift rule construct thousands of tapes,
+    # each carrying fresh measurement processes; using __slots__ avoids
+    # allocating a per-instance __dict__ for every one of them.
+    __slots__ = ("return_type", "obs", "_wires", "_eigvals", "name", "data", "queue_idx")
+
     def __init__(self, return_type, obs=None, wires=None, eigvals=None):
         self.return_type = return_type
         self.obs = obs
+        self.queue_idx = None  #: int, None: index of the measurement in the circuit queue
 
         if wires is not None and obs is not None:
             raise ValueError("Cannot set the wires if an observable is provided.")
@@ -72,12 +78,23 @@ class MeasurementProcess:
         # Below, we imitate an identity observable, so that the
         # device undertakes no action upon recieving this observable.
         self.name = "Identity"
-        self.diagonalizing_gates = lambda: []
         self.data = []
 
         # Queue the measurement process
         self.queue()
 
+    @staticmethod
+    def diagonalizing_gates():
+        """Returns the gates that diagonalize the measured wires.
+
+        As above, this imitates an identity observable, and is shared across
+        all instances rather than creating a closure per measurement process.
+
+        Returns:
+            list: empty list of diagonalizing gates
+        """
+        return []
+
     def __repr__(self):
         """Representation of this class."""
         if self.obs is None:
@@ -181,12 +198,10 @@ class MeasurementProcess:
         """Append the measurement process to an annotated queue."""
         if self.obs is not None:
             try:
-                qml.tape.QueuingContext.update_info(self.obs, owner=self)
+                qml.tape.QueuingContext.register_measurement(self.obs, self)
             except ValueError:
                 self.obs.queue()
-                qml.tape.QueuingContext.update_info(self.obs, owner=self)
-
-            qml.tape.QueuingContext.append(self, owns=self.obs)
+                qml.tape.QueuingContext.register_measurement(self.obs, self)
         else:
             qml.tape.QueuingContext.append(self)
 
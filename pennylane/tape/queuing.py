@@ -184,6 +184,26 @@ class QueuingContext(abc.ABC):
         """Updates information of an object in the queue instance."""
         raise NotImplementedError
 
+    @classmethod
+    def register_measurement(cls, obj, measurement):
+        """Annotate a queued object as owned by a measurement, and append the
+        measurement to the queue(s).
+
+        This is equivalent to ``update_info(obj, owner=measurement)`` followed
+        by ``append(measurement, owns=obj)``, but resolves the active queuing
+        context only once. Measurement processes queue themselves through this
+        method, so the saving scales with the number of measurements on a tape.
+
+        Args:
+            obj: the measured object, e.g., an observable
+            measurement: the measurement process that owns ``obj``
+        """
+        if cls.recording():
+            context = cls.active_context()
+            # pylint: disable=protected-access
+            context._update_info(obj, owner=measurement)
+            context._append(measurement, owns=obj)
+
     @classmethod
     def get_info(cls, obj):
         """Retrieves information of an object in the active queue.
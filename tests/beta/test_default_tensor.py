@@ -580,6 +580,22 @@ class TestDefaultTensorNetworkParametrize:
         ).reshape([2, 2, 2])
         assert np.allclose(ket, expected, atol=tol, rtol=0)
 
+    def test_probability(self, rep, tol):
+        """Tests that the probability method produces correct marginal probabilities."""
+
+        dev = qml.device("default.tensor", wires=3, representation=rep)
+
+        dev.apply("PauliX", Wires([0]), [])
+        dev.apply("Hadamard", Wires([1]), [])
+
+        probs = dev.probability(wires=Wires([0, 1]))
+        assert list(probs.keys()) == [(0, 0), (0, 1), (1, 0), (1, 1)]
+        assert np.allclose(list(probs.values()), [0.0, 0.0, 0.5, 0.5], atol=tol, rtol=0)
+
+        marginal = dev.probability(wires=Wires([1]))
+        assert list(marginal.keys()) == [(0,), (1,)]
+        assert np.allclose(list(marginal.values()), [0.5, 0.5], atol=tol, rtol=0)
+
 
 class TestDefaultTensorNetworkRepresentationDependentParametrize:
     """Tests of the basic tensor network functionality of default.tensor plugin where the
@@ -590,6 +606,20 @@ class TestDefaultTensorNetworkRepresentationDependentParametrize:
         with pytest.raises(ValueError, match="Invalid representation"):
             dev = qml.device("default.tensor", wires=2, representation="junk")
 
+    def test_exception_invalid_precision(self):
+        """Tests that an exception is raised if an invalid precision is given."""
+        with pytest.raises(ValueError, match="Invalid precision"):
+            dev = qml.device("default.tensor", wires=2, precision="half")
+
+    @pytest.mark.parametrize(
+        "precision,dtype", [("single", np.complex64), ("double", np.complex128)]
+    )
+    def test_precision_determines_state_dtype(self, precision, dtype):
+        """Tests that the precision argument sets the dtype of the simulated state."""
+        dev = qml.device("default.tensor", wires=2, precision=precision)
+        dev.apply("Hadamard", Wires([0]), [])
+        assert np.asarray(dev._state()).dtype == dtype
+
     @pytest.mark.parametrize(
         "rep,num_nodes,node_names",
         [
@@ -827,7 +857,7 @@ class TestDefaultTensorIntegration:
         capabilities = {"model": "qubit",
                         "supports_finite_shots": False,
                         "supports_tensor_observables": True,
-                        "returns_probs": False,
+                        "returns_probs": True,
                         "returns_state": False,
                         "supports_analytic_computation": True,
                         }
@@ -1379,6 +1409,35 @@ class TestTensorExpval:
 
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
+    def test_expval_many(self, theta, phi, varphi, rep, tol):
+        """Test that batched expectation values agree with term-by-term evaluation"""
+        dev = qml.device("default.tensor", wires=3, representation=rep)
+        dev.reset()
+        dev.apply("RX", wires=Wires([0]), par=[theta])
+        dev.apply("RX", wires=Wires([1]), par=[phi])
+        dev.apply("RX", wires=Wires([2]), par=[varphi])
+        dev.apply("CNOT", wires=Wires([0, 1]), par=[])
+        dev.apply("CNOT", wires=Wires([1, 2]), par=[])
+
+        observables = [
+            "PauliZ",
+            "Identity",
+            ["PauliZ", "PauliZ"],
+            ["PauliX", "PauliY"],
+        ]
+        obs_wires = [
+            Wires([0]),
+            Wires([1]),
+            [Wires([0]), Wires([2])],
+            [Wires([0]), Wires([2])],
+        ]
+        par = [[], [], [[], []], [[], []]]
+
+        res = dev.expval_many(observables, obs_wires, par)
+        expected = [dev.expval(o, w, p) for o, w, p in zip(observables, obs_wires, par)]
+
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
     def test_pauliz_hadamard(self, theta, phi, varphi, rep, tol):
         """Test that a tensor product involving PauliZ and PauliY and hadamard works correctly"""
         dev = qml.device("default.tensor", wires=3, representation=rep)
@@ -422,6 +422,22 @@ class TestQNodeIntegration:
 
         assert np.isclose(circuit(p), expected, atol=tol, rtol=0)
 
+    @pytest.mark.parametrize(
+        "precision, dtype", [("single", np.complex64), ("double", np.complex128)]
+    )
+    def test_precision_determines_state_dtype(self, rep, precision, dtype):
+        """Tests that the precision argument sets the dtype of the simulated state,
+        including for the parametrized gate matrices built by tf_ops."""
+        dev = qml.device("default.tensor.tf", wires=1, representation=rep, precision=precision)
+
+        @qml.qnode(dev, interface="tf")
+        def circuit(x):
+            qml.RX(x, wires=0)
+            return qml.expval(qml.PauliZ(0))
+
+        circuit(0.3)
+        assert np.asarray(dev._state()).dtype == dtype
+
     def test_correct_state(self, rep, tol):
         """Test that the device state is correct after applying a
         quantum function on the device"""
@@ -571,7 +587,7 @@ class TestInterfaceDeviceIntegration:
         capabilities = {"model": "qubit",
                         "supports_finite_shots": False,
                         "supports_tensor_observables": True,
-                        "returns_probs": False,
+                        "returns_probs": True,
                         "returns_state": False,
                         "supports_analytic_computation": True,
                         "passthru_interface": 'tf',
@@ -324,6 +324,30 @@ class TestAnnotatedQueue:
         with pytest.raises(ValueError, match="not in the queue"):
             q._update_info(B, inv=True)
 
+    def test_register_measurement(self):
+        """Test that register_measurement annotates the measured object and
+        appends the measurement in a single call"""
+        A = qml.RZ(0.5, wires=1)
+
+        with AnnotatedQueue() as q:
+            q.append(A)
+            QueuingContext.register_measurement(A, "measurement")
+
+        assert q.queue == [A, "measurement"]
+        assert q._get_info(A) == {"owner": "measurement"}
+        assert q._get_info("measurement") == {"owns": A}
+
+    def test_register_measurement_not_in_queue(self):
+        """Test that register_measurement raises an exception if the measured
+        object is not in the queue, without appending the measurement"""
+        A = qml.PauliY(1)
+
+        with AnnotatedQueue() as q:
+            with pytest.raises(ValueError, match="not in the queue"):
+                QueuingContext.register_measurement(A, "measurement")
+
+        assert q.queue == []
+
     def test_append_annotating_object(self):
         """Test appending an object that writes annotations when queuing itself"""
 